@@ -33,6 +33,7 @@ import java.util.HashSet;
 import java.util.List;
 import java.util.Map;
 import java.util.Set;
+import java.util.regex.Pattern;
 import java.util.stream.Collectors;
 import org.yaml.snakeyaml.Yaml;
 
@@ -50,6 +51,10 @@ public class OrthographicAcronymModel implements Serializable {
   static final IndexMap<Character> CASE_INSENS_SYMBOLS;
   static final Set<Character> CASE_INSENS_CHARS;
 
+  private static final Pattern NO_LETTERS = Pattern.compile("[^a-z]*");
+  private static final Pattern NO_CONSONANTS = Pattern.compile("[^bcdfghjklmnpqrstvwxz]*");
+  private static final Pattern NO_VOWELS = Pattern.compile("[^aeiouy]*");
+
   static {
     Set<Character> symbols = "abcdefghijklmnopqrstuvwxyz.-ABCDEFGHIJKLMNOPQRSTUVWXYZ0?^$".chars()
         .mapToObj(i -> (char) i)
@@ -115,14 +120,14 @@ public class OrthographicAcronymModel implements Serializable {
       return false;
     }
     // No letters? Then it's probably punctuation or a numeral
-    if (wordLower.matches("[^a-z]*")) {
+    if (NO_LETTERS.matcher(wordLower).matches()) {
       return false;
     }
     // No vowels, or only vowels? Then it's probably an abbreviation
-    if (wordLower.matches("[^bcdfghjklmnpqrstvwxz]*")) {
+    if (NO_CONSONANTS.matcher(wordLower).matches()) {
       return true;
     }
-    if (wordLower.matches("[^aeiouy]*")) {
+    if (NO_VOWELS.matcher(wordLower).matches()) {
       return true;
     }
 
@@ -17,8 +17,9 @@
 package edu.umn.biomedicus.common.viterbi;
 
 import edu.umn.biomedicus.common.grams.Bigram;
+import java.util.ArrayList;
 import java.util.Arrays;
-import java.util.LinkedList;
+import java.util.Collections;
 import java.util.List;
 import java.util.Objects;
 import java.util.function.BiFunction;
@@ -128,16 +129,17 @@ class Ancestor<S> {
    * @return a list of the hidden states leading to this ancestor.
    */
   List<S> getHistory(S skipValue) {
-    LinkedList<S> history = new LinkedList<>();
+    ArrayList<S> history = new ArrayList<>();
     HistoryChain<S> pointer = this.historyChain;
     while (pointer != null) {
       S payload = pointer.getState();
       if (payload == null) {
         payload = skipValue;
       }
-      history.addFirst(payload);
+      history.add(payload);
       pointer = pointer.getPrevious();
     }
+    Collections.reverse(history);
     return history;
   }
 
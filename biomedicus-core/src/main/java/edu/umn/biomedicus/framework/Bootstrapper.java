@@ -229,7 +229,7 @@ public final class Bootstrapper {
         while (settingsFilesItr.hasNext()) {
           Path settingsFilePath = settingsFilesItr.next();
           SettingsLoader settingsLoader = SettingsLoader
-              .createSettingsLoader(settingsFilePath);
+              .createSettingsLoader(yaml, settingsFilePath);
           settingsLoader.loadSettings();
           settingsLoader.addToBinder(settingsBinder);
           systems.addSystems(settingsLoader.getSystemClasses());
@@ -250,7 +250,7 @@ public final class Bootstrapper {
       try {
         Path overloadFilePath = Paths.get(overloadFile);
         settingsLoader = SettingsLoader
-            .createSettingsLoader(absoluteOrResolveAgainstHome(overloadFilePath));
+            .createSettingsLoader(yaml, absoluteOrResolveAgainstHome(overloadFilePath));
       } catch (IOException e) {
         throw new BiomedicusException(e);
       }
@@ -51,9 +51,12 @@ class SettingsLoader {
     this.configurations.putAll(configurations);
   }
 
-  static SettingsLoader createSettingsLoader(Path settingsFilePath) throws IOException {
+  static SettingsLoader createSettingsLoader(
+      Yaml yaml,
+      Path settingsFilePath
+  ) throws IOException {
     try (BufferedReader bufferedReader = Files.newBufferedReader(settingsFilePath)) {
-      return new SettingsLoader(new Yaml().load(bufferedReader));
+      return new SettingsLoader(yaml.load(bufferedReader));
     }
   }
 
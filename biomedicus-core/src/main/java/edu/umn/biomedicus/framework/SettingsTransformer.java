@@ -90,25 +90,10 @@ public class SettingsTransformer {
             Key.get(Path.class, annotationFunction.apply(key + ".asPath")),
             path
         );
-        if (!path.isAbsolute()) {
-          settings.putIfAbsent(
-              Key.get(Path.class, annotationFunction.apply(key + ".asDataPath")),
-              dataPath.resolve(path)
-          );
-          settings.putIfAbsent(
-              Key.get(String.class, annotationFunction.apply(key + ".asDataPath")),
-              dataPath.resolve(path).toString()
-          );
-        } else {
-          settings.putIfAbsent(
-              Key.get(Path.class, annotationFunction.apply(key + ".asDataPath")),
-              path
-          );
-          settings.putIfAbsent(
-              Key.get(String.class, annotationFunction.apply(key + ".asDataPath")),
-              path.toString()
-          );
-        }
+        Path dataResolved = absoluteOrResolveAgainstData(path);
+        Annotation asDataPath = annotationFunction.apply(key + ".asDataPath");
+        settings.putIfAbsent(Key.get(Path.class, asDataPath), dataResolved);
+        settings.putIfAbsent(Key.get(String.class, asDataPath), dataResolved.toString());
       } else {
         addSetting(key, value, value.getClass());
       }
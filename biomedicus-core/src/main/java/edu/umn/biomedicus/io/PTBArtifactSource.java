@@ -34,11 +34,15 @@ import java.io.IOException;
 import java.nio.charset.Charset;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.nio.file.attribute.BasicFileAttributes;
 import java.util.ArrayList;
 import java.util.Iterator;
 import java.util.List;
 import java.util.Optional;
 import java.util.Spliterator;
+import java.util.function.BiPredicate;
+import java.util.stream.Collectors;
+import java.util.stream.Stream;
 import kotlin.Unit;
 import kotlin.jvm.functions.Function1;
 import javax.annotation.Nonnull;
@@ -71,9 +75,14 @@ public class PTBArtifactSource implements ArtifactSource {
       @ComponentSetting("documentName") String documentName
   ) throws IOException {
     charset = Charset.forName(charsetName);
-    total = Files.walk(directoryPath).filter(f -> f.toString().endsWith(extension)).count();
-    iterator = Files.walk(directoryPath)
-        .filter(f -> f.toString().endsWith(extension)).spliterator();
+    BiPredicate<Path, BasicFileAttributes> matcher = (path, attrs) -> !attrs.isDirectory()
+        && path.getFileName().toString().endsWith(extension);
+    List<Path> paths;
+    try (Stream<Path> found = Files.find(directoryPath, Integer.MAX_VALUE, matcher)) {
+      paths = found.collect(Collectors.toList());
+    }
+    total = paths.size();
+    iterator = paths.spliterator();
     this.viewName = documentName;
   }
 
@@ -26,7 +26,12 @@ import java.nio.charset.Charset;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.attribute.BasicFileAttributes;
+import java.util.List;
 import java.util.Spliterator;
+import java.util.function.BiPredicate;
+import java.util.stream.Collectors;
+import java.util.stream.Stream;
 import kotlin.Unit;
 import kotlin.jvm.functions.Function1;
 import javax.annotation.Nonnull;
@@ -64,10 +69,15 @@ public class TextFilesArtifactSource implements ArtifactSource {
   ) throws IOException {
     charset = Charset.forName(charsetName);
     inputDirectory = Paths.get(directoryPath);
-    total = Files.walk(inputDirectory).filter(f -> f.toString().endsWith(extension)).count();
+    BiPredicate<Path, BasicFileAttributes> matcher = (path, attrs) -> !attrs.isDirectory()
+        && path.getFileName().toString().endsWith(extension);
+    List<Path> paths;
+    try (Stream<Path> found = Files.find(inputDirectory, Integer.MAX_VALUE, matcher)) {
+      paths = found.collect(Collectors.toList());
+    }
+    total = paths.size();
     LOGGER.debug("Reading {} files from {}", total, inputDirectory);
-    iterator = Files.walk(inputDirectory).filter(f -> f.toString().endsWith(extension))
-        .spliterator();
+    iterator = paths.spliterator();
     this.documentName = documentName;
   }
 
@@ -23,31 +23,35 @@ import edu.umn.biomedicus.tokenization.TermToken;
 import edu.umn.nlpengine.LabelIndex;
 import edu.umn.nlpengine.Span;
 import java.util.ArrayList;
-import java.util.Arrays;
 import java.util.Collections;
+import java.util.EnumSet;
+import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.Set;
 import javax.annotation.Nullable;
 
 class ContextCues {
 
-  private final List<List<String>> leftPhrases;
+  private final PhraseNode leftPhrases;
   private final List<ModificationType> leftTypes;
   private final int maxSizeLeftPhrase;
-  private final List<List<String>> rightPhrases;
+  private final PhraseNode rightPhrases;
   private final List<ModificationType> rightTypes;
   private final int maxSizeRightPhrase;
-  private final List<PartOfSpeech> scopeDelimitersPos;
-  private final List<String> scopeDelimiterWords;
+  private final Set<PartOfSpeech> scopeDelimitersPos;
+  private final Set<String> scopeDelimiterWords;
 
   private ContextCues(
-      List<List<String>> leftPhrases,
+      PhraseNode leftPhrases,
       List<ModificationType> leftTypes,
       int maxSizeLeftPhrase,
-      List<List<String>> rightPhrases,
+      PhraseNode rightPhrases,
       List<ModificationType> rightTypes,
       int maxSizeRightPhrase,
-      List<PartOfSpeech> scopeDelimitersPos,
-      List<String> scopeDelimiterWords
+      Set<PartOfSpeech> scopeDelimitersPos,
+      Set<String> scopeDelimiterWords
   ) {
     this.leftPhrases = leftPhrases;
     this.leftTypes = leftTypes;
@@ -67,35 +71,34 @@ class ContextCues {
   private Pair<Integer, List<Span>> search(
       List<TermToken> parseTokenLabels,
       LabelIndex<PosTag> partOfSpeeches,
-      List<List<String>> phrases,
+      PhraseNode phrases,
       int maxSize
   ) {
     int size = parseTokenLabels.size();
     for (int i = 0; i < size; i++) {
       TermToken firstParseToken = parseTokenLabels.get(i);
+      String word = firstParseToken.getText();
+      if (scopeDelimiterWords.contains(word)) {
+        return null;
+      }
       for (PosTag posTag : partOfSpeeches.inside(firstParseToken)) {
         if (scopeDelimitersPos.contains(posTag.getPartOfSpeech())) {
           return null;
         }
       }
-      String word = firstParseToken.getText();
-      if (scopeDelimiterWords.contains(word)) {
-        return null;
-      }
       int limit = Math.min(size - i, maxSize);
-      for (int j = i + 1; j <= limit; j++) {
-        List<TermToken> leftRange = parseTokenLabels.subList(i, i + j);
-        List<String> leftSearch = new ArrayList<>(leftRange.size());
-        for (TermToken termToken : leftRange) {
-          leftSearch.add(termToken.getText());
+      PhraseNode node = phrases;
+      for (int j = 1; j <= limit; j++) {
+        node = node.children.get(parseTokenLabels.get(i + j - 1).getText());
+        if (node == null) {
+          break;
         }
-        int indexOf = phrases.indexOf(leftSearch);
-        if (indexOf != -1) {
+        if (node.phraseIndex != -1) {
           ArrayList<Span> result = new ArrayList<>();
-          for (TermToken tokenLabel : leftRange) {
+          for (TermToken tokenLabel : parseTokenLabels.subList(i, i + j)) {
             result.add(tokenLabel.toSpan());
           }
-          return new Pair<>(indexOf, result);
+          return new Pair<>(node.phraseIndex, result);
         }
       }
     }
@@ -127,12 +130,12 @@ class ContextCues {
 
   static class Builder {
 
-    private final List<List<String>> leftPhrases = new ArrayList<>();
+    private final PhraseNode leftPhrases = new PhraseNode();
     private final List<ModificationType> leftTypes = new ArrayList<>();
-    private final List<List<String>> rightPhrases = new ArrayList<>();
+    private final PhraseNode rightPhrases = new PhraseNode();
     private final List<ModificationType> rightTypes = new ArrayList<>();
-    private final List<PartOfSpeech> scopeDelimitersPos = new ArrayList<>();
-    private final List<String> scopeDelimiterWords = new ArrayList<>();
+    private final Set<PartOfSpeech> scopeDelimitersPos = EnumSet.noneOf(PartOfSpeech.class);
+    private final Set<String> scopeDelimiterWords = new HashSet<>();
     private int maxSizeLeftPhrase = 0;
     private int maxSizeRightPhrase = 0;
 
@@ -140,7 +143,11 @@ class ContextCues {
       if (words.length > maxSizeRightPhrase) {
         maxSizeRightPhrase = words.length;
       }
-      rightPhrases.add(Arrays.asList(words));
+      PhraseNode node = rightPhrases;
+      for (String word : words) {
+        node = node.child(word);
+      }
+      node.mark(rightTypes.size());
       rightTypes.add(modificationType);
       return this;
     }
@@ -149,9 +156,12 @@ class ContextCues {
       if (words.length > maxSizeLeftPhrase) {
         maxSizeLeftPhrase = words.length;
       }
-      List<String> wordsList = Arrays.asList(words);
-      Collections.reverse(wordsList);
-      leftPhrases.add(wordsList);
+      // left phrases are matched walking backward from the term
+      PhraseNode node = leftPhrases;
+      for (int i = words.length - 1; i >= 0; i--) {
+        node = node.child(words[i]);
+      }
+      node.mark(leftTypes.size());
       leftTypes.add(modificationType);
       return this;
     }
@@ -167,9 +177,30 @@ class ContextCues {
     }
 
     ContextCues build() {
-      return new ContextCues(leftPhrases, leftTypes, maxSizeLeftPhrase, rightPhrases, rightTypes,
-          maxSizeRightPhrase,
+      return new ContextCues(leftPhrases, leftTypes, maxSizeLeftPhrase,
+          rightPhrases, rightTypes, maxSizeRightPhrase,
           scopeDelimitersPos, scopeDelimiterWords);
     }
   }
+
+  /**
+   * A node in a trie of cue phrases keyed by token text. Lets a search extend a candidate phrase
+   * one token at a time instead of comparing it against every phrase.
+   */
+  private static class PhraseNode {
+
+    private final Map<String, PhraseNode> children = new HashMap<>();
+
+    private int phraseIndex = -1;
+
+    private PhraseNode child(String word) {
+      return children.computeIfAbsent(word, unused -> new PhraseNode());
+    }
+
+    private void mark(int index) {
+      if (phraseIndex == -1) {
+        phraseIndex = index;
+      }
+    }
+  }
 }
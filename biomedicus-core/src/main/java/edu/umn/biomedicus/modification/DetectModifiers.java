@@ -141,15 +141,19 @@ public class DetectModifiers implements DocumentTask {
 
     Labeler<ModificationCue> cueLabeler = document.labeler(ModificationCue.class);
 
+    Sentence sentenceLabel = null;
+    LabelIndex<TermToken> sentenceTokenLabels = null;
     for (DictionaryTerm termLabel : dictionaryTermLabelIndex) {
-      Sentence sentenceLabel = sentenceLabelIndex.containing(termLabel).first();
+      // terms are visited in order, so consecutive terms usually share a sentence
+      if (sentenceLabel == null || !sentenceLabel.contains(termLabel)) {
+        sentenceLabel = sentenceLabelIndex.containing(termLabel).first();
 
-      if (sentenceLabel == null) {
-        sentenceLabelIndex.containing(termLabel);
-        throw new RuntimeException("Term outside of a sentence.");
-      }
+        if (sentenceLabel == null) {
+          throw new RuntimeException("Term outside of a sentence.");
+        }
 
-      LabelIndex<TermToken> sentenceTokenLabels = tokenLabelIndex.inside(sentenceLabel);
+        sentenceTokenLabels = tokenLabelIndex.inside(sentenceLabel);
+      }
 
       List<TermToken> contextList = sentenceTokenLabels.backwardFrom(termLabel).asList();
 
@@ -49,6 +49,8 @@ public final class SyntaxnetParser implements DocumentTask {
 
   private static final Logger LOGGER = LoggerFactory.getLogger(SyntaxnetParser.class);
 
+  private static final int BUFFER_SIZE = 1 << 16;
+
   private final Path installationDir;
 
   private final String modelDirString;
@@ -85,6 +87,12 @@ public final class SyntaxnetParser implements DocumentTask {
     };
   }
 
+  private static void startDaemon(Runnable runnable, String name) {
+    Thread thread = new Thread(runnable, name);
+    thread.setDaemon(true);
+    thread.start();
+  }
+
   @Override
   public void run(@Nonnull Document document) {
     LabelIndex<Sentence> sentenceLabelIndex = document.labelIndex(Sentence.class);
@@ -96,8 +104,10 @@ public final class SyntaxnetParser implements DocumentTask {
     Path parserEval = installationDir.resolve("bazel-bin/syntaxnet/parser_eval");
     Path modelDir = installationDir.resolve(modelDirString);
 
+    Process parser = null;
+    Process tagger = null;
     try {
-      Process parser = new ProcessBuilder()
+      parser = new ProcessBuilder()
           .directory(installationDir.toFile())
           .command(parserEval.toString(),
               "--input=stdin-conll",
@@ -111,7 +121,7 @@ public final class SyntaxnetParser implements DocumentTask {
               "--slim_model",
               "--batch_size=1024")
           .start();
-      Process tagger = new ProcessBuilder()
+      tagger = new ProcessBuilder()
           .directory(installationDir.toFile())
           .command(parserEval.toString(),
               "--input=stdin-conll",
@@ -126,50 +136,64 @@ public final class SyntaxnetParser implements DocumentTask {
               "--batch_size=1024")
           .start();
 
-      new Thread(errorStreamLogger(tagger)).start();
-
-      new Thread(errorStreamLogger(parser)).start();
+      communicate(tagger, parser, sentenceLabelIndex, tokenLabelIndex);
+    } catch (IOException e) {
+      throw new RuntimeException(e);
+    } finally {
+      if (tagger != null) {
+        tagger.destroy();
+      }
+      if (parser != null) {
+        parser.destroy();
+      }
+    }
+  }
 
-      new Thread(() -> {
-        try (InputStream inputStream = tagger.getInputStream();
-            OutputStream outputStream = parser.getOutputStream()) {
-          int in;
-          while ((in = inputStream.read()) != -1) {
-            outputStream.write(in);
-          }
-        } catch (IOException e) {
-          LOGGER.error("Error transferring from input to output.");
-        }
-      }).start();
-
-      try (Writer writer = new OutputStreamWriter(
-          tagger.getOutputStream())) {
-        for (Sentence sentence : sentenceLabelIndex) {
-          Collection<ParseToken> sentenceTokens = tokenLabelIndex
-              .inside(sentence);
-          String conllString = new Tokens2Conll(sentenceTokens)
-              .conllString();
-          writer.write(conllString);
-          writer.write("\n");
+  private static void communicate(
+      Process tagger,
+      Process parser,
+      LabelIndex<Sentence> sentenceLabelIndex,
+      LabelIndex<ParseToken> tokenLabelIndex
+  ) throws IOException {
+    startDaemon(errorStreamLogger(tagger), "syntaxnet-tagger-stderr");
+
+    startDaemon(errorStreamLogger(parser), "syntaxnet-parser-stderr");
+
+    startDaemon(() -> {
+      try (InputStream inputStream = tagger.getInputStream();
+          OutputStream outputStream = parser.getOutputStream()) {
+        byte[] buffer = new byte[BUFFER_SIZE];
+        int read;
+        while ((read = inputStream.read(buffer)) != -1) {
+          outputStream.write(buffer, 0, read);
         }
+      } catch (IOException e) {
+        LOGGER.error("Error transferring from input to output.");
       }
+    }, "syntaxnet-tagger-to-parser");
+
+    try (Writer writer = new OutputStreamWriter(
+        tagger.getOutputStream())) {
+      for (Sentence sentence : sentenceLabelIndex) {
+        Collection<ParseToken> sentenceTokens = tokenLabelIndex
+            .inside(sentence);
+        String conllString = new Tokens2Conll(sentenceTokens)
+            .conllString();
+        writer.write(conllString);
+        writer.write("\n");
+      }
+    }
 
-      try (BufferedReader bufferedReader = new BufferedReader(
-          new InputStreamReader(parser.getInputStream()))) {
-        for (Sentence sentence : sentenceLabelIndex) {
-          StringBuilder sentenceParse = new StringBuilder();
-          String line;
-          while ((line = bufferedReader.readLine()) != null && !line
-              .isEmpty()) {
-            sentenceParse.append(line).append("\n");
-          }
+    try (BufferedReader bufferedReader = new BufferedReader(
+        new InputStreamReader(parser.getInputStream()))) {
+      for (Sentence sentence : sentenceLabelIndex) {
+        StringBuilder sentenceParse = new StringBuilder();
+        String line;
+        while ((line = bufferedReader.readLine()) != null && !line
+            .isEmpty()) {
+          sentenceParse.append(line).append("\n");
         }
       }
-
-      parser.destroy();
-      tagger.destroy();
-    } catch (IOException e) {
-      throw new RuntimeException(e);
     }
   }
 }
@@ -21,12 +21,17 @@ import edu.umn.biomedicus.annotations.ComponentSetting;
 import edu.umn.nlpengine.Artifact;
 import edu.umn.nlpengine.ArtifactSource;
 import edu.umn.nlpengine.StandardArtifact;
+import java.io.BufferedReader;
 import java.io.IOException;
 import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.nio.file.attribute.BasicFileAttributes;
+import java.util.List;
 import java.util.Spliterator;
-import java.util.function.Predicate;
+import java.util.function.BiPredicate;
+import java.util.stream.Collectors;
+import java.util.stream.Stream;
 import kotlin.Unit;
 import kotlin.jvm.functions.Function1;
 import javax.annotation.Nonnull;
@@ -48,9 +53,14 @@ public class MipacqSourceReader implements ArtifactSource {
       @ComponentSetting("documentName") String documentName
   ) throws IOException {
     this.documentName = documentName;
-    Predicate<Path> endsWithSource = f -> f.toString().endsWith(".source");
-    total = Files.walk(inputDirectory).filter(endsWithSource).count();
-    iterator = Files.walk(inputDirectory).filter(endsWithSource).spliterator();
+    BiPredicate<Path, BasicFileAttributes> isSource = (path, attrs) -> !attrs.isDirectory()
+        && path.getFileName().toString().endsWith(".source");
+    List<Path> paths;
+    try (Stream<Path> found = Files.find(inputDirectory, Integer.MAX_VALUE, isSource)) {
+      paths = found.collect(Collectors.toList());
+    }
+    total = paths.size();
+    iterator = paths.spliterator();
   }
 
   @Override
@@ -67,12 +77,13 @@ public class MipacqSourceReader implements ArtifactSource {
   public boolean tryAdvance(@Nonnull Function1<? super Artifact, Unit> consumer) {
     return iterator.tryAdvance((next) -> {
       StringBuilder sb = new StringBuilder();
-      try {
-        Files.lines(next, StandardCharsets.UTF_8).forEach(line -> {
+      try (BufferedReader reader = Files.newBufferedReader(next, StandardCharsets.UTF_8)) {
+        String line;
+        while ((line = reader.readLine()) != null) {
           if (!line.startsWith("[")) {
             sb.append(line).append("\n");
           }
-        });
+        }
       } catch (IOException e) {
         e.printStackTrace();
       }
@@ -20,6 +20,7 @@ import edu.umn.biomedicus.annotations.ComponentSetting
 import edu.umn.nlpengine.Artifact
 import edu.umn.nlpengine.ArtifactSource
 import edu.umn.nlpengine.StandardArtifact
+import org.slf4j.LoggerFactory
 import org.yaml.snakeyaml.Yaml
 import java.io.File
 import java.io.FileInputStream
@@ -27,12 +28,20 @@ import java.nio.file.Path
 import java.sql.Connection
 import java.sql.DriverManager
 import java.sql.ResultSet
+import java.sql.SQLException
 import java.sql.Statement
 import java.util.*
 import javax.inject.Inject
 
 /**
  * A document source that pulls from a database using JDBC.
+ *
+ * Besides the connection and column settings, the config file accepts `readOnly`, which defaults
+ * to `true` and should be set to `false` for queries that have side effects, and `fetchSize`, the
+ * number of rows the driver is asked to fetch per round trip, which defaults to 256. Read-only
+ * queries run with autocommit off, which PostgreSQL requires before it will stream rows through a
+ * cursor; MySQL additionally needs `useCursorFetch=true` in `properties`. Queries with `readOnly`
+ * set to `false` keep the driver's autocommit so their side effects are committed as they run.
  */
 class JdbcArtifactSource @Inject internal constructor(
         @ComponentSetting("documentName") private val documentName: String,
@@ -77,7 +86,22 @@ class JdbcArtifactSource @Inject internal constructor(
         props.putAll(config["properties"] as Map<out Any, Any>)
 
         connection = DriverManager.getConnection(config["url"] as String, props)
-        statement = connection.createStatement()
+        if (config["readOnly"] as? Boolean != false) {
+            try {
+                connection.isReadOnly = true
+            } catch (e: SQLException) {
+                // some drivers only accept the read-only flag as a connection property
+                log.warn("JDBC driver rejected read-only mode, continuing with the connection " +
+                        "as opened", e)
+            }
+            // drivers like PostgreSQL only honor the fetch size inside a transaction
+            connection.autoCommit = false
+        }
+        statement = connection.createStatement(
+                ResultSet.TYPE_FORWARD_ONLY,
+                ResultSet.CONCUR_READ_ONLY
+        )
+        statement.fetchSize = config["fetchSize"] as? Int ?: 256
         val queryText = File(config["queryFile"] as String).readText()
         resultSet = statement.executeQuery(queryText)
 
@@ -130,4 +154,8 @@ class JdbcArtifactSource @Inject internal constructor(
 
         }
     }
+
+    companion object {
+        private val log = LoggerFactory.getLogger(JdbcArtifactSource::class.java)
+    }
 }
@@ -30,8 +30,10 @@ import javax.inject.Inject
  */
 class PlainTextWriter @Inject constructor(
         @ComponentSetting("outputDirectory.asPath") private val outputDirectory: Path,
-        @ComponentSetting("charset") private val charsetName: String
+        @ComponentSetting("charset") charsetName: String
 ) : DocumentTask {
+    private val charset = Charset.forName(charsetName)
+
     init {
         log.debug("Writing plain text files to directory: {}", outputDirectory)
     }
@@ -39,8 +41,7 @@ class PlainTextWriter @Inject constructor(
     override fun run(document: Document) {
         outputDirectory.resolve("${document.artifactID}.txt")
                 .also { Files.createDirectories(it.parent) }
-                .toFile().writeText(document.text, Charset.forName(charsetName))
-
+                .toFile().writeText(document.text, charset)
     }
 
     companion object {
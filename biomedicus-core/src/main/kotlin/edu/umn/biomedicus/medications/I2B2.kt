@@ -34,7 +34,7 @@ fun main(args: Array<String>) {
         if (!it.isFile) return@forEach
 
         it.forEachLine {
-            val splits = columnSplitter.split(it)
+            val splits = columnSplitter.split(it, 3)
             val dosageMatch = dosageRegex.find(splits[1])
             val dosageString = dosageMatch!!.groupValues[1]
 
@@ -0,0 +1,177 @@
+/*
+ * Copyright (c) 2018 Regents of the University of Minnesota.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package edu.umn.biomedicus.modification;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertNotNull;
+import static org.junit.jupiter.api.Assertions.assertNull;
+
+import edu.umn.biomedicus.common.tuples.Pair;
+import edu.umn.biomedicus.common.types.syntax.PartOfSpeech;
+import edu.umn.biomedicus.tagging.PosTag;
+import edu.umn.biomedicus.tokenization.TermToken;
+import edu.umn.nlpengine.LabelIndex;
+import edu.umn.nlpengine.Span;
+import edu.umn.nlpengine.StandardLabelIndex;
+import java.util.Arrays;
+import java.util.List;
+import org.junit.jupiter.api.Test;
+
+/**
+ * Test for {@link ContextCues}.
+ */
+class ContextCuesTest {
+
+  private static final LabelIndex<PosTag> NO_TAGS = StandardLabelIndex.create(PosTag.class);
+
+  @Test
+  void testLeftPhraseMatchesBackwardFromTerm() {
+    ContextCues cues = ContextCues.builder()
+        .addLeftPhrase(ModificationType.NEGATED, "no", "history", "of")
+        .build();
+
+    // "no history of pain", walking backward from "pain"
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(11, 13, "of", true),
+        new TermToken(3, 10, "history", true),
+        new TermToken(0, 2, "no", true)
+    );
+
+    Pair<ModificationType, List<Span>> result = cues.searchLeft(tokens, NO_TAGS);
+
+    assertNotNull(result);
+    assertEquals(ModificationType.NEGATED, result.first());
+    assertEquals(Arrays.asList(new Span(0, 2), new Span(3, 10), new Span(11, 13)),
+        result.second());
+  }
+
+  @Test
+  void testRightPhraseMatches() {
+    ContextCues cues = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "ruled", "out")
+        .build();
+
+    // "pain was ruled out", walking forward from "pain"
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(5, 8, "was", true),
+        new TermToken(9, 14, "ruled", true),
+        new TermToken(15, 18, "out", false)
+    );
+
+    Pair<ModificationType, List<Span>> result = cues.searchRight(tokens, NO_TAGS);
+
+    assertNotNull(result);
+    assertEquals(ModificationType.NEGATED, result.first());
+    assertEquals(Arrays.asList(new Span(9, 14), new Span(15, 18)), result.second());
+  }
+
+  @Test
+  void testFirstTypeAddedWins() {
+    ContextCues cues = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "ruled", "out")
+        .addRightPhrase(ModificationType.HISTORICAL, "ruled", "out")
+        .build();
+
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(0, 5, "ruled", true),
+        new TermToken(6, 9, "out", false)
+    );
+
+    Pair<ModificationType, List<Span>> result = cues.searchRight(tokens, NO_TAGS);
+
+    assertNotNull(result);
+    assertEquals(ModificationType.NEGATED, result.first());
+  }
+
+  @Test
+  void testScopeDelimitingWordStopsSearch() {
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(0, 3, "and", true),
+        new TermToken(4, 9, "ruled", true),
+        new TermToken(10, 13, "out", false)
+    );
+
+    ContextCues withoutDelimiter = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "ruled", "out")
+        .build();
+    assertNotNull(withoutDelimiter.searchRight(tokens, NO_TAGS));
+
+    ContextCues cues = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "ruled", "out")
+        .addScopeDelimitingWord("and")
+        .build();
+    assertNull(cues.searchRight(tokens, NO_TAGS));
+  }
+
+  @Test
+  void testScopeDelimitingPosStopsSearch() {
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(0, 3, "and", true),
+        new TermToken(4, 9, "ruled", true),
+        new TermToken(10, 13, "out", false)
+    );
+    LabelIndex<PosTag> tags = StandardLabelIndex.create(PosTag.class,
+        new PosTag(0, 3, PartOfSpeech.CC),
+        new PosTag(4, 9, PartOfSpeech.VBN),
+        new PosTag(10, 13, PartOfSpeech.RP)
+    );
+
+    ContextCues cues = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "ruled", "out")
+        .addScopeDelimitingPos(PartOfSpeech.CC)
+        .build();
+
+    assertNull(cues.searchRight(tokens, tags));
+  }
+
+  @Test
+  void testShortPhraseMatchesAfterFirstPosition() {
+    ContextCues cues = ContextCues.builder()
+        .addRightPhrase(ModificationType.NEGATED, "out")
+        .build();
+
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(0, 3, "was", true),
+        new TermToken(4, 7, "out", false)
+    );
+
+    Pair<ModificationType, List<Span>> result = cues.searchRight(tokens, NO_TAGS);
+
+    assertNotNull(result);
+    assertEquals(ModificationType.NEGATED, result.first());
+    assertEquals(Arrays.asList(new Span(4, 7)), result.second());
+  }
+
+  @Test
+  void testSingleTokenLeftPhraseMatchesAfterFirstPosition() {
+    ContextCues cues = ContextCues.builder()
+        .addLeftPhrase(ModificationType.NEGATED, "denies")
+        .build();
+
+    // "denies any pain", walking backward from "pain"
+    List<TermToken> tokens = Arrays.asList(
+        new TermToken(7, 10, "any", true),
+        new TermToken(0, 6, "denies", true)
+    );
+
+    Pair<ModificationType, List<Span>> result = cues.searchLeft(tokens, NO_TAGS);
+
+    assertNotNull(result);
+    assertEquals(ModificationType.NEGATED, result.first());
+    assertEquals(Arrays.asList(new Span(0, 6)), result.second());
+  }
+}
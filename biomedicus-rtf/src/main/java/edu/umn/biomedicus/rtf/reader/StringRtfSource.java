@@ -0,0 +1,50 @@
+/*
+ * Copyright (c) 2018 Regents of the University of Minnesota.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package edu.umn.biomedicus.rtf.reader;
+
+/**
+ * An rtf source which reads directly from an in-memory string of rtf, without the per-character
+ * locking and mark bookkeeping of a {@link java.io.Reader}.
+ */
+public class StringRtfSource implements RtfSource {
+
+  private final String rtf;
+
+  private int index;
+
+  public StringRtfSource(String rtf) {
+    this.rtf = rtf;
+    index = 0;
+  }
+
+  @Override
+  public int getIndex() {
+    return index;
+  }
+
+  @Override
+  public int readCharacter() {
+    int code = index < rtf.length() ? rtf.charAt(index) : -1;
+    index++;
+    return code;
+  }
+
+  @Override
+  public void unreadChar() {
+    index--;
+  }
+}
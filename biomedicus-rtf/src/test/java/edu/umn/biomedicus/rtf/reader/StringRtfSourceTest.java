@@ -0,0 +1,93 @@
+/*
+ * Copyright (c) 2018 Regents of the University of Minnesota.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package edu.umn.biomedicus.rtf.reader;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+
+import edu.umn.biomedicus.rtf.exc.RtfReaderException;
+import java.io.StringReader;
+import org.junit.jupiter.api.Test;
+
+/**
+ * Test for {@link StringRtfSource}, checking it against {@link ReaderRtfSource}.
+ */
+class StringRtfSourceTest {
+
+  private static final String RTF = "{\\rtf1\\ansi a\\par b}";
+
+  private final ReaderRtfSource expected = new ReaderRtfSource(new StringReader(RTF));
+
+  private final StringRtfSource actual = new StringRtfSource(RTF);
+
+  private void assertSameRead() throws RtfReaderException {
+    assertEquals(expected.readCharacter(), actual.readCharacter());
+    assertEquals(expected.getIndex(), actual.getIndex());
+  }
+
+  private void assertSameUnread() throws RtfReaderException {
+    expected.unreadChar();
+    actual.unreadChar();
+    assertEquals(expected.getIndex(), actual.getIndex());
+  }
+
+  @Test
+  void testInitialIndex() {
+    assertEquals(expected.getIndex(), actual.getIndex());
+  }
+
+  @Test
+  void testReadsWholeString() throws RtfReaderException {
+    for (int i = 0; i < RTF.length(); i++) {
+      assertSameRead();
+    }
+    assertEquals(RTF.length(), actual.getIndex());
+  }
+
+  @Test
+  void testUnreadRereadsCharacter() throws RtfReaderException {
+    for (int i = 0; i < 5; i++) {
+      assertSameRead();
+    }
+    assertSameUnread();
+    assertSameRead();
+    assertSameRead();
+  }
+
+  @Test
+  void testReadsPastEnd() throws RtfReaderException {
+    for (int i = 0; i < RTF.length(); i++) {
+      assertSameRead();
+    }
+    for (int i = 0; i < 3; i++) {
+      assertSameRead();
+    }
+    assertEquals(-1, actual.readCharacter());
+  }
+
+  @Test
+  void testUnreadAtEnd() throws RtfReaderException {
+    for (int i = 0; i < RTF.length(); i++) {
+      assertSameRead();
+    }
+    assertSameRead();
+    assertSameUnread();
+    assertSameRead();
+
+    assertSameUnread();
+    assertEquals(RTF.length(), actual.getIndex());
+  }
+}
@@ -17,12 +17,11 @@
 package edu.umn.biomedicus.uima.rtf;
 
 import edu.umn.biomedicus.rtf.exc.RtfReaderException;
-import edu.umn.biomedicus.rtf.reader.ReaderRtfSource;
 import edu.umn.biomedicus.rtf.reader.RtfParser;
 import edu.umn.biomedicus.rtf.reader.RtfSource;
+import edu.umn.biomedicus.rtf.reader.StringRtfSource;
 import edu.umn.biomedicus.uima.adapter.UimaAdapters;
 import edu.umn.nlpengine.Artifact;
-import java.io.StringReader;
 import java.util.Objects;
 import javax.annotation.Nullable;
 import org.apache.uima.UimaContext;
@@ -140,8 +139,7 @@ public class RtfParserAnnotator extends CasAnnotator_ImplBase {
     boolean isRtf;
     boolean parsed = false;
     if (documentText.indexOf("{\\rtf1") == 0) {
-      StringReader reader = new StringReader(documentText);
-      RtfSource rtfSource = new ReaderRtfSource(reader);
+      RtfSource rtfSource = new StringRtfSource(documentText);
 
       RtfParser parser;
       try {
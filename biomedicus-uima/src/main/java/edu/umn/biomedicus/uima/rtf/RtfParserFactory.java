@@ -28,8 +28,11 @@ import edu.umn.biomedicus.rtf.reader.RtfParser;
 import edu.umn.biomedicus.rtf.reader.RtfSource;
 import edu.umn.biomedicus.rtf.reader.State;
 import java.io.IOException;
+import java.net.URL;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.function.Function;
 import java.util.stream.Collectors;
 import org.apache.uima.cas.CAS;
 import org.apache.uima.cas.Type;
@@ -42,6 +45,20 @@ import org.apache.uima.cas.Type;
  */
 class RtfParserFactory {
 
+  /**
+   * Unmarshalled descriptor files by the URL their classpath reference resolves to, shared by all
+   * the annotator instances in the JVM. Keying on the resolved URL keeps annotators with different
+   * extension classpaths from sharing a descriptor that only has the same path. The descriptor beans
+   * are only read after loading.
+   */
+  private static final Map<String, PropertiesDescription> PROPERTIES_DESCRIPTIONS
+      = new ConcurrentHashMap<>();
+
+  private static final Map<String, ControlKeywordsDescription> CONTROL_KEYWORDS_DESCRIPTIONS
+      = new ConcurrentHashMap<>();
+
+  private static final Map<String, CasMappings> CAS_MAPPINGS = new ConcurrentHashMap<>();
+
   /**
    * The initial properties to set a state to.
    */
@@ -95,25 +112,50 @@ class RtfParserFactory {
       String casMappingsDescriptionClassPathRef,
       boolean writeTables
   ) {
-    PropertiesDescription propertiesDescription = PropertiesDescription
-        .loadFromFile(propertiesDescriptionClasspathRef);
+    PropertiesDescription propertiesDescription = loadCached(PROPERTIES_DESCRIPTIONS,
+        propertiesDescriptionClasspathRef, PropertiesDescription::loadFromFile);
 
     Map<String, Map<String, Integer>> properties = propertiesDescription
         .createProperties();
 
-    ControlKeywordsDescription controlKeywordsDescription = ControlKeywordsDescription
-        .loadFromFile(controlKeywordsDescriptionClasspathRef);
+    ControlKeywordsDescription controlKeywordsDescription = loadCached(
+        CONTROL_KEYWORDS_DESCRIPTIONS, controlKeywordsDescriptionClasspathRef,
+        ControlKeywordsDescription::loadFromFile);
 
     Map<String, KeywordAction> keywordActionMap = controlKeywordsDescription
         .getKeywordActionsAsMap();
 
-    CasMappings casMappings = CasMappings.loadFromFile(casMappingsDescriptionClassPathRef);
+    CasMappings casMappings = loadCached(CAS_MAPPINGS, casMappingsDescriptionClassPathRef,
+        CasMappings::loadFromFile);
 
     RtfKeywordParser rtfKeywordParser = new RtfKeywordParser(keywordActionMap);
 
     return new RtfParserFactory(properties, rtfKeywordParser, casMappings, writeTables);
   }
 
+  /**
+   * Loads a descriptor file through the cache, keyed on the resource the thread context class
+   * loader resolves the classpath reference to.
+   *
+   * @param cache the cache for this kind of descriptor
+   * @param classpathRef the classpath reference to the descriptor file
+   * @param loader loads the descriptor from a classpath reference
+   * @param <T> the descriptor type
+   * @return the cached or newly loaded descriptor
+   */
+  private static <T> T loadCached(
+      Map<String, T> cache,
+      String classpathRef,
+      Function<String, T> loader
+  ) {
+    URL resource = Thread.currentThread().getContextClassLoader().getResource(classpathRef);
+    if (resource == null) {
+      // nothing to key on, let the loader report the missing file
+      return loader.apply(classpathRef);
+    }
+    return cache.computeIfAbsent(resource.toExternalForm(), unused -> loader.apply(classpathRef));
+  }
+
   /**
    * Parses the rtf source into a set of UIMA CAS views.
    *
@@ -17,10 +17,12 @@
 package edu.umn.biomedicus.uima.util;
 
 import java.io.IOException;
-import java.util.ArrayList;
 import java.util.List;
 import java.util.concurrent.Callable;
+import java.util.concurrent.CopyOnWriteArrayList;
 import java.util.concurrent.Semaphore;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
 import java.util.function.Consumer;
 import javax.annotation.Nullable;
 import org.apache.uima.UIMAFramework;
@@ -54,11 +56,12 @@ public class SimpleRunCPE implements Callable<Void> {
 
   private final Semaphore completionSemaphore = new Semaphore(0);
 
-  private int entityCount = 0;
+  // updated from every processing unit thread when the CPE runs them in parallel
+  private final AtomicInteger entityCount = new AtomicInteger();
 
-  private long size = 0;
+  private final AtomicLong size = new AtomicLong();
 
-  private final List<Exception> exceptions = new ArrayList<>();
+  private final List<Exception> exceptions = new CopyOnWriteArrayList<>();
 
   @Nullable
   private Consumer<CAS> casConsumer = null;
@@ -76,17 +79,19 @@ public class SimpleRunCPE implements Callable<Void> {
 
       @Override
       public void batchProcessComplete() {
-        LOGGER.info("Completed " + entityCount + " documents");
-        if (size > 0) {
-          LOGGER.info("; " + size + " characters");
+        LOGGER.info("Completed " + entityCount.get() + " documents");
+        long characters = size.get();
+        if (characters > 0) {
+          LOGGER.info("; " + characters + " characters");
         }
       }
 
       @Override
       public void collectionProcessComplete() {
-        LOGGER.info("Completed " + entityCount + " documents");
-        if (size > 0) {
-          LOGGER.info("; " + size + " characters");
+        LOGGER.info("Completed " + entityCount.get() + " documents");
+        long characters = size.get();
+        if (characters > 0) {
+          LOGGER.info("; " + characters + " characters");
         }
         LOGGER.info(
             "PERFORMANCE REPORT \n" + collectionProcessingEngine.getPerformanceReport().toString());
@@ -113,21 +118,22 @@ public class SimpleRunCPE implements Callable<Void> {
 
       @Override
       public void entityProcessComplete(CAS aCas, EntityProcessStatus aStatus) {
-        exceptions.addAll(aStatus.getExceptions());
+        List<Exception> entityExceptions = aStatus.getExceptions();
+        exceptions.addAll(entityExceptions);
         LOGGER.debug(aStatus.getStatusMessage());
 
         if (casConsumer != null) {
           casConsumer.accept(aCas);
         }
 
-        for (Exception exception : exceptions) {
+        for (Exception exception : entityExceptions) {
           LOGGER.error("Exception processing a CAS: ", exception);
         }
 
-        entityCount++;
+        entityCount.incrementAndGet();
         String docText = aCas.getDocumentText();
         if (docText != null) {
-          size += docText.length();
+          size.addAndGet(docText.length());
         }
       }
     });
@@ -54,11 +54,11 @@ class XmiCollectionReader : CollectionReader_ImplBase() {
                 .let { it as? Boolean }
                 ?.let { addDocumentId = it }
 
-        total = File(inputDirectory).walkTopDown().maxDepth(recurseDepth)
-                .count { it.extension == extension }
-        iterator = File(inputDirectory).walkTopDown().maxDepth(recurseDepth)
+        val files = File(inputDirectory).walkTopDown().maxDepth(recurseDepth)
                 .filter { it.extension == extension }
-                .iterator()
+                .toList()
+        total = files.size
+        iterator = files.iterator()
     }
 
     override fun getProgress(): Array<Progress> {